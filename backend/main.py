@@ -1,22 +1,37 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Body, Depends, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy import Float, String, cast, exists, insert, literal, null, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from typing import List, Optional
 from datetime import datetime
+import anyio
+import orjson
 
-from database import get_db, init_db
+from database import SessionLocal, engine, get_db, init_db
 from models import Asset, AssetVersion, Evidence
 from schemas import (
-    AssetCreate, AssetResponse, 
-    EvidenceCreate, EvidenceResponse,
-    TimelineEvent, AssetVersionResponse
+    AssetCreate, AssetResponse, AssetPage,
+    EvidenceCreate, EvidenceResponse, EvidencePage,
+    TimelineEvent, TimelineVersionDetails, TimelineEvidenceDetails,
+    AssetVersionResponse
 )
 
+# Largest page a list endpoint will return
+MAX_PAGE_SIZE = 1000
+
+# Most records a bulk endpoint accepts per request; keeps each request to
+# one bounded transaction and the asset ID check well under bind limits
+MAX_BULK_SIZE = 1000
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Land Truth Registry API",
     description="Immutable land registry system with evidence tracking",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -30,13 +45,19 @@ app.add_middleware(
 
 
 @app.on_event("startup")
-def startup_event():
+async def startup_event():
     """Initialize database on startup"""
-    init_db()
+    await init_db()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled database connections on shutdown"""
+    await engine.dispose()
 
 
 @app.get("/", tags=["Health"])
-def root():
+async def root():
     """Health check endpoint"""
     return {
         "status": "online",
@@ -46,53 +67,119 @@ def root():
 
 
 @app.post("/assets/", response_model=AssetResponse, status_code=status.HTTP_201_CREATED, tags=["Assets"])
-def create_asset(asset: AssetCreate, db: Session = Depends(get_db)):
+async def create_asset(asset: AssetCreate):
     """
     Create a new asset and initialize its version history with a Genesis block.
     
     CRITICAL: This endpoint implements the "Genesis Creation" pattern.
     Every new asset gets an immediate AssetVersion entry to anchor its history.
     """
-    # Create the asset
-    db_asset = Asset(
-        name=asset.name,
-        owner=asset.owner,
-        location_lat=asset.location_lat,
-        location_lon=asset.location_lon,
-        size_hectares=asset.size_hectares
-    )
-    db.add(db_asset)
-    db.flush()  # Flush to get the ID without committing
-    
-    # CRITICAL: Create Genesis version entry
-    genesis_version = AssetVersion(
-        asset_id=db_asset.id,
-        name=asset.name,
-        owner=asset.owner,
-        change_reason="Genesis Creation"
-    )
-    db.add(genesis_version)
-    db.commit()
-    db.refresh(db_asset)
+    # Session is scoped to the DB work only, so the connection goes back
+    # to the pool before the response is serialized and sent
+    async with SessionLocal() as db:
+        # Create the asset; RETURNING hands back the ID and server defaults
+        # so no flush or refresh round-trip is needed
+        inserted = await db.scalars(insert(Asset).values(**asset.model_dump()).returning(Asset))
+        db_asset = inserted.one()
+        
+        # CRITICAL: Create Genesis version entry
+        await db.execute(insert(AssetVersion).values(
+            asset_id=db_asset.id,
+            name=db_asset.name,
+            owner=db_asset.owner,
+            change_reason="Genesis Creation"
+        ))
+        await db.commit()
+        result = AssetResponse.model_validate(db_asset)
     
-    return db_asset
+    return result
 
 
-@app.get("/assets/", response_model=List[AssetResponse], tags=["Assets"])
-def get_assets(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@app.post("/assets/bulk", response_model=List[AssetResponse], status_code=status.HTTP_201_CREATED, tags=["Assets"])
+async def create_assets_bulk(assets: List[AssetCreate] = Body(..., max_length=MAX_BULK_SIZE)):
     """
-    Retrieve all assets with pagination.
+    Create many assets in one request, each with its Genesis version.
+    
+    Assets and their Genesis versions are written with one multi-row
+    INSERT per table inside a single transaction.
     """
-    assets = db.query(Asset).offset(skip).limit(limit).all()
-    return assets
+    if not assets:
+        return []
+    
+    async with SessionLocal() as db:
+        # Insert all assets, returning rows in the same order as the payload
+        result = await db.scalars(
+            insert(Asset).returning(Asset, sort_by_parameter_order=True),
+            [asset.model_dump() for asset in assets]
+        )
+        db_assets = result.all()
+        
+        # CRITICAL: Create Genesis version entries for every new asset
+        await db.execute(
+            insert(AssetVersion),
+            [
+                {
+                    "asset_id": db_asset.id,
+                    "name": db_asset.name,
+                    "owner": db_asset.owner,
+                    "change_reason": "Genesis Creation"
+                }
+                for db_asset in db_assets
+            ]
+        )
+        await db.commit()
+        results = [AssetResponse.model_validate(db_asset) for db_asset in db_assets]
+    
+    return results
+
+
+@app.get("/assets/", response_model=AssetPage, tags=["Assets"])
+async def get_assets(
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve assets with cursor pagination, ordered by ID.
+    
+    Pass the returned next_cursor as after_id to fetch the following page.
+    No total count is computed; clients should use has_more to offer
+    "load more" rather than numbered pages.
+    """
+    # Plain column select: rows come back as mappings with no ORM identity
+    # map or relationship machinery. Fetch one extra row to learn whether
+    # another page exists.
+    stmt = select(
+        Asset.id,
+        Asset.name,
+        Asset.owner,
+        Asset.location_lat,
+        Asset.location_lon,
+        Asset.size_hectares,
+        Asset.created_at
+    ).order_by(Asset.id).limit(limit + 1)
+    if after_id is not None:
+        stmt = stmt.where(Asset.id > after_id)
+    result = await db.execute(stmt)
+    rows = result.mappings().all()
+    has_more = len(rows) > limit
+    # Rows come straight from our own schema, so skip re-validation
+    assets = [AssetResponse.model_construct(**row) for row in rows[:limit]]
+    return {
+        "items": assets,
+        "has_more": has_more,
+        "next_cursor": assets[-1].id if has_more else None
+    }
 
 
 @app.get("/assets/{asset_id}", response_model=AssetResponse, tags=["Assets"])
-def get_asset(asset_id: int, db: Session = Depends(get_db)):
+async def get_asset(asset_id: int, db: AsyncSession = Depends(get_db)):
     """
     Retrieve a specific asset by ID.
     """
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    stmt = select(Asset).options(raiseload("*")).where(Asset.id == asset_id)
+    result = await db.execute(stmt)
+    asset = result.scalar_one_or_none()
     if not asset:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -102,96 +189,277 @@ def get_asset(asset_id: int, db: Session = Depends(get_db)):
 
 
 @app.post("/evidence/", response_model=EvidenceResponse, status_code=status.HTTP_201_CREATED, tags=["Evidence"])
-def create_evidence(evidence: EvidenceCreate, db: Session = Depends(get_db)):
+async def create_evidence(evidence: EvidenceCreate):
     """
     Log evidence for an asset.
     Validates that the asset exists before creating evidence.
     """
-    # Verify asset exists
-    asset = db.query(Asset).filter(Asset.id == evidence.asset_id).first()
-    if not asset:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Asset with ID {evidence.asset_id} not found"
-        )
+    # INSERT ... SELECT ... FROM assets WHERE id = :asset_id RETURNING *
+    # The existence check and the insert are one atomic statement:
+    # no row is inserted (or returned) when the asset is missing.
+    stmt = insert(Evidence).from_select(
+        ["asset_id", "evidence_type", "description", "gps_lat", "gps_lon"],
+        select(
+            Asset.id,
+            literal(evidence.evidence_type),
+            literal(evidence.description),
+            literal(evidence.gps_lat),
+            literal(evidence.gps_lon)
+        ).where(Asset.id == evidence.asset_id)
+    ).returning(Evidence)
     
-    # Create evidence
-    db_evidence = Evidence(
-        asset_id=evidence.asset_id,
-        evidence_type=evidence.evidence_type,
-        description=evidence.description,
-        gps_lat=evidence.gps_lat,
-        gps_lon=evidence.gps_lon
-    )
-    db.add(db_evidence)
-    db.commit()
-    db.refresh(db_evidence)
+    async with SessionLocal() as db:
+        inserted = await db.scalars(stmt)
+        db_evidence = inserted.first()
+        if db_evidence is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Asset with ID {evidence.asset_id} not found"
+            )
+        await db.commit()
+        result = EvidenceResponse.model_validate(db_evidence)
     
-    return db_evidence
+    return result
 
 
-@app.get("/assets/{asset_id}/timeline", response_model=List[TimelineEvent], tags=["Timeline"])
-def get_asset_timeline(asset_id: int, db: Session = Depends(get_db)):
+@app.post("/evidence/bulk", response_model=List[EvidenceResponse], status_code=status.HTTP_201_CREATED, tags=["Evidence"])
+async def create_evidence_bulk(evidence: List[EvidenceCreate] = Body(..., max_length=MAX_BULK_SIZE)):
     """
-    Retrieve the complete timeline for an asset.
+    Log many evidence records in one request.
+    Validates that every referenced asset exists before inserting anything.
+    """
+    if not evidence:
+        return []
     
-    Merges AssetVersion and Evidence records into a unified timeline,
+    async with SessionLocal() as db:
+        # Verify all referenced assets exist
+        asset_ids = {record.asset_id for record in evidence}
+        found = await db.scalars(select(Asset.id).where(Asset.id.in_(asset_ids)))
+        missing = sorted(asset_ids - set(found.all()))
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Assets with IDs {missing} not found"
+            )
+        
+        # Create evidence with a Core executemany against the table: no ORM
+        # instances, unit-of-work bookkeeping or events per row
+        evidence_table = Evidence.__table__
+        result = await db.execute(
+            insert(evidence_table).returning(*evidence_table.c, sort_by_parameter_order=True),
+            [record.model_dump() for record in evidence]
+        )
+        rows = result.mappings().all()
+        await db.commit()
+        results = [EvidenceResponse.model_construct(**row) for row in rows]
+    
+    return results
+
+
+def timeline_query(asset_id: int, limit: Optional[int]):
+    """
+    Build the unified timeline query for an asset.
+    
+    Merges AssetVersion and Evidence records into one result set,
     sorted by timestamp in descending order (most recent first).
     """
-    # Verify asset exists
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
-    if not asset:
+    # Normalize both tables to the same column layout
+    versions = select(
+        literal("version").label("event_type"),
+        AssetVersion.changed_at.label("timestamp"),
+        AssetVersion.change_reason.label("description"),
+        AssetVersion.id.label("record_id"),
+        AssetVersion.name.label("name"),
+        AssetVersion.owner.label("owner"),
+        cast(null(), String(100)).label("evidence_type"),
+        cast(null(), Float).label("gps_lat"),
+        cast(null(), Float).label("gps_lon"),
+    ).where(AssetVersion.asset_id == asset_id)
+    
+    evidence = select(
+        literal("evidence").label("event_type"),
+        Evidence.timestamp.label("timestamp"),
+        Evidence.description.label("description"),
+        Evidence.id.label("record_id"),
+        cast(null(), String(255)).label("name"),
+        cast(null(), String(255)).label("owner"),
+        Evidence.evidence_type.label("evidence_type"),
+        Evidence.gps_lat.label("gps_lat"),
+        Evidence.gps_lon.label("gps_lon"),
+    ).where(Evidence.asset_id == asset_id)
+    
+    # Timestamps default to the transaction start time, so rows written
+    # together share one; the tiebreakers keep the order deterministic.
+    # Within each branch event_type is constant, so the order reduces to
+    # (time DESC, id DESC), which the branch's (asset_id, time DESC, id DESC)
+    # index returns pre-sorted. The database can then merge the two sorted
+    # runs in linear time (e.g. a Postgres Merge Append) rather than
+    # sorting here in Python.
+    events = union_all(versions, evidence).subquery()
+    return select(events).order_by(
+        events.c.timestamp.desc(),
+        events.c.event_type,
+        events.c.record_id.desc()
+    ).limit(limit)
+
+
+def timeline_event(row) -> TimelineEvent:
+    """
+    Convert a row of the unified timeline query into a TimelineEvent.
+    Rows come from our own tables, so models are built without validation.
+    """
+    if row["event_type"] == "version":
+        return TimelineEvent.model_construct(
+            event_type="version",
+            timestamp=row["timestamp"],
+            description=row["description"],
+            details=TimelineVersionDetails.model_construct(
+                name=row["name"],
+                owner=row["owner"],
+                version_id=row["record_id"]
+            )
+        )
+    return TimelineEvent.model_construct(
+        event_type="evidence",
+        timestamp=row["timestamp"],
+        description=f"{row['evidence_type']}: {row['description']}",
+        details=TimelineEvidenceDetails.model_construct(
+            evidence_type=row["evidence_type"],
+            gps_lat=row["gps_lat"],
+            gps_lon=row["gps_lon"],
+            evidence_id=row["record_id"]
+        )
+    )
+
+
+async def ensure_asset_exists(db: AsyncSession, asset_id: int):
+    """Raise 404 if the asset does not exist"""
+    if not await db.scalar(select(exists().where(Asset.id == asset_id))):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Asset with ID {asset_id} not found"
         )
+
+
+@app.get("/assets/{asset_id}/timeline", response_model=List[TimelineEvent], tags=["Timeline"])
+async def get_asset_timeline(
+    asset_id: int,
+    limit: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve the complete timeline for an asset.
+    
+    Merges AssetVersion and Evidence records into a unified timeline,
+    sorted by timestamp in descending order (most recent first).
+    The merge and sort happen in the database via a single UNION ALL query.
+    Pass limit to fetch only the most recent events.
+    """
+    result = await db.execute(timeline_query(asset_id, limit))
+    rows = result.mappings().all()
     
-    # Fetch versions
-    versions = db.query(AssetVersion).filter(AssetVersion.asset_id == asset_id).all()
+    # Every asset has a Genesis version, so an empty timeline almost always
+    # means the asset does not exist. Only then do we pay for the check.
+    if not rows:
+        await ensure_asset_exists(db, asset_id)
     
-    # Fetch evidence
-    evidence_records = db.query(Evidence).filter(Evidence.asset_id == asset_id).all()
+    return [timeline_event(row) for row in rows]
+
+
+@app.get("/assets/{asset_id}/timeline/stream", tags=["Timeline"])
+async def stream_asset_timeline(asset_id: int, limit: Optional[int] = Query(None, ge=1)):
+    """
+    Stream the timeline for an asset as NDJSON (one event per line).
     
-    # Build unified timeline
-    timeline = []
+    Rows are read from a server-side cursor and written out as they
+    arrive, so memory stays flat for assets with thousands of events and
+    clients can start rendering before the whole timeline is sent.
+    """
+    # The session lives as long as the stream, so it is closed by the
+    # response rather than by a request-scoped dependency
+    db = SessionLocal()
     
-    # Add version events
-    for version in versions:
-        timeline.append(TimelineEvent(
-            event_type="version",
-            timestamp=version.changed_at,
-            description=version.change_reason,
-            details={
-                "name": version.name,
-                "owner": version.owner,
-                "version_id": version.id
-            }
-        ))
+    async def close_session():
+        # Shielded so a cancelled stream (client disconnect) still returns
+        # the connection to the pool; closing twice is a no-op
+        with anyio.CancelScope(shield=True):
+            await db.close()
     
-    # Add evidence events
-    for evidence in evidence_records:
-        timeline.append(TimelineEvent(
-            event_type="evidence",
-            timestamp=evidence.timestamp,
-            description=f"{evidence.evidence_type}: {evidence.description}",
-            details={
-                "evidence_type": evidence.evidence_type,
-                "gps_lat": evidence.gps_lat,
-                "gps_lon": evidence.gps_lon,
-                "evidence_id": evidence.id
-            }
-        ))
+    try:
+        result = await db.stream(timeline_query(asset_id, limit))
+        rows = result.mappings()
+        # Read the first row up front so a missing asset can still get a 404
+        first = await rows.fetchone()
+        if first is None:
+            await ensure_asset_exists(db, asset_id)
+    except BaseException:
+        await close_session()
+        raise
     
-    # Sort by timestamp descending (most recent first)
-    timeline.sort(key=lambda x: x.timestamp, reverse=True)
+    async def events():
+        try:
+            if first is not None:
+                yield orjson.dumps(timeline_event(first).model_dump()) + b"\n"
+                async for row in rows:
+                    yield orjson.dumps(timeline_event(row).model_dump()) + b"\n"
+        finally:
+            await close_session()
     
-    return timeline
+    # On disconnect Starlette cancels the stream and may leave the generator
+    # suspended, but still runs the background task, which closes the session
+    return StreamingResponse(
+        events(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(close_session)
+    )
 
 
-@app.get("/evidence/", response_model=List[EvidenceResponse], tags=["Evidence"])
-def get_all_evidence(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@app.get("/evidence/", response_model=EvidencePage, tags=["Evidence"])
+async def get_all_evidence(
+    after_timestamp: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    Retrieve all evidence records with pagination.
+    Retrieve evidence records with cursor pagination, ordered by (timestamp, id).
+    
+    Pass the returned next_cursor's timestamp and id as after_timestamp and
+    after_id to fetch the following page. The id tiebreaker keeps the order
+    stable when several records share a timestamp. No total count is
+    computed; use has_more to decide whether to offer "load more".
     """
-    evidence = db.query(Evidence).offset(skip).limit(limit).all()
-    return evidence
+    if (after_timestamp is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_timestamp and after_id must be provided together"
+        )
+    
+    # Fetch one extra row to learn whether another page exists
+    stmt = (
+        select(
+            Evidence.id,
+            Evidence.asset_id,
+            Evidence.evidence_type,
+            Evidence.description,
+            Evidence.gps_lat,
+            Evidence.gps_lon,
+            Evidence.timestamp
+        )
+        .order_by(Evidence.timestamp, Evidence.id)
+        .limit(limit + 1)
+    )
+    if after_id is not None:
+        stmt = stmt.where(tuple_(Evidence.timestamp, Evidence.id) > tuple_(after_timestamp, after_id))
+    result = await db.execute(stmt)
+    rows = result.mappings().all()
+    has_more = len(rows) > limit
+    evidence = [EvidenceResponse.model_construct(**row) for row in rows[:limit]]
+    return {
+        "items": evidence,
+        "has_more": has_more,
+        "next_cursor": (
+            {"timestamp": evidence[-1].timestamp, "id": evidence[-1].id}
+            if has_more else None
+        )
+    }
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Index
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from database import Base
 
@@ -20,8 +20,16 @@ class Asset(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
-    versions = relationship("AssetVersion", back_populates="asset", cascade="all, delete-orphan")
-    evidence = relationship("Evidence", back_populates="asset", cascade="all, delete-orphan")
+    # lazy="raise": collections must be loaded explicitly (selectinload) so
+    # serialization can never fall into N+1 queries
+    versions = relationship(
+        "AssetVersion", back_populates="asset", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise"
+    )
+    evidence = relationship(
+        "Evidence", back_populates="asset", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="raise"
+    )
 
 
 class AssetVersion(Base):
@@ -30,16 +38,22 @@ class AssetVersion(Base):
     Each row represents a snapshot or change event.
     """
     __tablename__ = "asset_versions"
+    __table_args__ = (
+        # Serves the timeline query: filter by asset, read newest first,
+        # with id as the tiebreaker for rows sharing a timestamp.
+        # Its leading asset_id column also covers plain asset_id lookups.
+        Index("ix_asset_versions_asset_id_changed_at_id", "asset_id", text("changed_at DESC"), text("id DESC")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    asset_id = Column(Integer, ForeignKey("assets.id", ondelete="CASCADE"), nullable=False, index=True)
+    asset_id = Column(Integer, ForeignKey("assets.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     owner = Column(String(255), nullable=False)
     change_reason = Column(String(500), nullable=False)
     changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationship
-    asset = relationship("Asset", back_populates="versions")
+    asset = relationship("Asset", back_populates="versions", lazy="raise")
 
 
 class Evidence(Base):
@@ -48,9 +62,17 @@ class Evidence(Base):
     Includes GPS coordinates and timestamps for verification.
     """
     __tablename__ = "evidence"
+    __table_args__ = (
+        # Serves the timeline query: filter by asset, read newest first,
+        # with id as the tiebreaker for rows sharing a timestamp.
+        # Its leading asset_id column also covers plain asset_id lookups.
+        Index("ix_evidence_asset_id_timestamp_id", "asset_id", text("timestamp DESC"), text("id DESC")),
+        # Serves keyset pagination over (timestamp, id)
+        Index("ix_evidence_timestamp_id", "timestamp", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    asset_id = Column(Integer, ForeignKey("assets.id", ondelete="CASCADE"), nullable=False, index=True)
+    asset_id = Column(Integer, ForeignKey("assets.id", ondelete="CASCADE"), nullable=False)
     evidence_type = Column(String(100), nullable=False)
     description = Column(Text, nullable=False)
     gps_lat = Column(Float, nullable=False)
@@ -58,4 +80,4 @@ class Evidence(Base):
     timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationship
-    asset = relationship("Asset", back_populates="evidence")
+    asset = relationship("Asset", back_populates="evidence", lazy="raise")
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional, Union
 
 
 # Asset Schemas
@@ -38,6 +38,16 @@ class AssetResponse(BaseModel):
         from_attributes = True
 
 
+class AssetPage(BaseModel):
+    """
+    Schema for a page of assets; next_cursor is the after_id for the next page.
+    Deliberately carries no total count, which would cost a COUNT(*) scan.
+    """
+    items: List[AssetResponse]
+    has_more: bool
+    next_cursor: Optional[int] = None
+
+
 # Evidence Schemas
 class EvidenceCreate(BaseModel):
     """Schema for creating evidence"""
@@ -73,13 +83,46 @@ class EvidenceResponse(BaseModel):
         from_attributes = True
 
 
+class EvidenceCursor(BaseModel):
+    """Position of the last evidence record in a page"""
+    timestamp: datetime
+    id: int
+
+
+class EvidencePage(BaseModel):
+    """
+    Schema for a page of evidence records.
+    Deliberately carries no total count, which would cost a COUNT(*) scan.
+    """
+    items: List[EvidenceResponse]
+    has_more: bool
+    next_cursor: Optional[EvidenceCursor] = None
+
+
 # Timeline Schemas
+class TimelineVersionDetails(BaseModel):
+    """Details attached to a version timeline event"""
+    name: str
+    owner: str
+    version_id: int
+
+
+class TimelineEvidenceDetails(BaseModel):
+    """Details attached to an evidence timeline event"""
+    evidence_type: str
+    gps_lat: float
+    gps_lon: float
+    evidence_id: int
+
+
 class TimelineEvent(BaseModel):
     """Unified schema for timeline events (versions and evidence)"""
-    event_type: str  # "version" or "evidence"
+    event_type: Literal["version", "evidence"]
     timestamp: datetime
     description: str
-    details: Optional[dict] = None
+    # The two detail models share no required fields, so the union
+    # resolves unambiguously without a tag inside details
+    details: Union[TimelineVersionDetails, TimelineEvidenceDetails]
 
     class Config:
         json_schema_extra = {
@@ -87,7 +130,7 @@ class TimelineEvent(BaseModel):
                 "event_type": "version",
                 "timestamp": "2024-01-04T15:30:00",
                 "description": "Genesis Creation",
-                "details": {"owner": "John Doe", "name": "Mashonaland Plot 4"}
+                "details": {"name": "Mashonaland Plot 4", "owner": "John Doe", "version_id": 1}
             }
         }
 
@@ -3,12 +3,20 @@ Seed data script for Land Truth Registry MVP.
 Creates demo assets with Zimbabwe coordinates and historical data.
 """
 import requests
+from requests.adapters import HTTPAdapter
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 API_URL = "http://localhost:8000"
 MAX_RETRIES = 30
 RETRY_DELAY = 2  # seconds
+EVIDENCE_BATCH_SIZE = 500  # records per bulk request
+MAX_WORKERS = 8  # concurrent bulk requests
+
+# Reuse pooled keep-alive connections for every call to the API
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
 
 
 def wait_for_api():
@@ -16,7 +24,7 @@ def wait_for_api():
     print("Waiting for API to be available...")
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(f"{API_URL}/")
+            response = session.get(f"{API_URL}/")
             if response.status_code == 200:
                 print("✅ API is online!")
                 return True
@@ -30,36 +38,84 @@ def wait_for_api():
     return False
 
 
-def create_asset(name, owner, lat, lon, size):
-    """Create an asset and return its ID"""
-    payload = {
-        "name": name,
-        "owner": owner,
-        "location_lat": lat,
-        "location_lon": lon,
-        "size_hectares": size
-    }
-    response = requests.post(f"{API_URL}/assets/", json=payload)
+def create_assets(assets):
+    """Create assets in a single bulk request and return their IDs in order"""
+    response = session.post(f"{API_URL}/assets/bulk", json=assets)
     response.raise_for_status()
-    asset = response.json()
-    print(f"✅ Created asset: {name} (ID: {asset['id']})")
-    return asset['id']
-
-
-def log_evidence(asset_id, evidence_type, description, lat, lon):
-    """Log evidence for an asset"""
-    payload = {
-        "asset_id": asset_id,
-        "evidence_type": evidence_type,
-        "description": description,
-        "gps_lat": lat,
-        "gps_lon": lon
-    }
-    response = requests.post(f"{API_URL}/evidence/", json=payload)
+    created = response.json()
+    for asset in created:
+        print(f"✅ Created asset: {asset['name']} (ID: {asset['id']})")
+    return [asset['id'] for asset in created]
+
+
+def post_evidence_batch(batch):
+    """Log one batch of evidence records with a single bulk request"""
+    response = session.post(f"{API_URL}/evidence/bulk", json=batch)
     response.raise_for_status()
-    evidence = response.json()
-    print(f"  📸 Logged evidence: {evidence_type} - {description}")
-    return evidence['id']
+    return response.json()
+
+
+def log_evidence(evidence):
+    """
+    Log evidence for many assets.
+    Records are split into batches which are posted concurrently, so large
+    seeds overlap the server's commit waits instead of queueing behind them.
+    """
+    batches = [
+        evidence[i:i + EVIDENCE_BATCH_SIZE]
+        for i in range(0, len(evidence), EVIDENCE_BATCH_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # map() yields results in submission order, keeping output stable
+        created = [record for batch in executor.map(post_evidence_batch, batches) for record in batch]
+    for record in created:
+        print(f"  📸 Logged evidence for asset {record['asset_id']}: "
+              f"{record['evidence_type']} - {record['description']}")
+    return [record['id'] for record in created]
+
+
+# Demo assets with Zimbabwe coordinates, each with its evidence records
+# as (evidence_type, description, gps_lat, gps_lon) tuples
+SEED_ASSETS = [
+    {
+        "name": "Mashonaland Plot 4",
+        "owner": "Tendai Moyo",
+        "location_lat": -17.8252,
+        "location_lon": 31.0335,
+        "size_hectares": 12.5,
+        "evidence": [
+            ("Photo", "Boundary fencing completed - northern perimeter", -17.8250, 31.0330),
+            ("Survey", "Land survey conducted by Zimbabwe Surveyor General", -17.8252, 31.0335),
+            ("Document", "Title deed registration confirmed at Deeds Office", -17.8252, 31.0335),
+            ("Inspection", "Soil quality assessment - Grade A agricultural land", -17.8255, 31.0340),
+        ],
+    },
+    {
+        "name": "Harare Warehouse District",
+        "owner": "Zimbabwe Commercial Properties Ltd",
+        "location_lat": -17.8292,
+        "location_lon": 31.0522,
+        "size_hectares": 3.2,
+        "evidence": [
+            ("Photo", "Warehouse construction phase 1 completed", -17.8292, 31.0522),
+            ("Document", "Building permit approved by Harare City Council", -17.8292, 31.0522),
+            ("Inspection", "Fire safety inspection passed - Certificate issued", -17.8290, 31.0520),
+        ],
+    },
+    {
+        "name": "Manicaland Orchard Estate",
+        "owner": "Nyasha Chikwanha",
+        "location_lat": -18.9707,
+        "location_lon": 32.6729,
+        "size_hectares": 25.8,
+        "evidence": [
+            ("Photo", "Citrus orchard planting - 500 trees planted", -18.9705, 32.6725),
+            ("Harvest Report", "First harvest yield: 12 tonnes of oranges", -18.9707, 32.6729),
+            ("Survey", "Irrigation system installation completed", -18.9710, 32.6730),
+            ("Document", "Organic certification awarded by Zimbabwe Organic Producers", -18.9707, 32.6729),
+        ],
+    },
+]
 
 
 def seed_data():
@@ -68,128 +124,35 @@ def seed_data():
     print("🌱 SEEDING LAND TRUTH REGISTRY DATABASE")
     print("="*60 + "\n")
     
-    # Asset 1: Mashonaland Plot 4
-    print("📍 Creating Asset 1: Mashonaland Plot 4")
-    asset1_id = create_asset(
-        name="Mashonaland Plot 4",
-        owner="Tendai Moyo",
-        lat=-17.8252,
-        lon=31.0335,
-        size=12.5
-    )
-    
-    # Evidence for Asset 1
-    log_evidence(
-        asset1_id,
-        "Photo",
-        "Boundary fencing completed - northern perimeter",
-        -17.8250,
-        31.0330
-    )
-    log_evidence(
-        asset1_id,
-        "Survey",
-        "Land survey conducted by Zimbabwe Surveyor General",
-        -17.8252,
-        31.0335
-    )
-    log_evidence(
-        asset1_id,
-        "Document",
-        "Title deed registration confirmed at Deeds Office",
-        -17.8252,
-        31.0335
-    )
-    log_evidence(
-        asset1_id,
-        "Inspection",
-        "Soil quality assessment - Grade A agricultural land",
-        -17.8255,
-        31.0340
-    )
-    
-    print()
-    
-    # Asset 2: Harare Warehouse District
-    print("📍 Creating Asset 2: Harare Warehouse District")
-    asset2_id = create_asset(
-        name="Harare Warehouse District",
-        owner="Zimbabwe Commercial Properties Ltd",
-        lat=-17.8292,
-        lon=31.0522,
-        size=3.2
-    )
-    
-    # Evidence for Asset 2
-    log_evidence(
-        asset2_id,
-        "Photo",
-        "Warehouse construction phase 1 completed",
-        -17.8292,
-        31.0522
-    )
-    log_evidence(
-        asset2_id,
-        "Document",
-        "Building permit approved by Harare City Council",
-        -17.8292,
-        31.0522
-    )
-    log_evidence(
-        asset2_id,
-        "Inspection",
-        "Fire safety inspection passed - Certificate issued",
-        -17.8290,
-        31.0520
-    )
+    # Create all assets in one request
+    print(f"📍 Creating {len(SEED_ASSETS)} assets")
+    asset_ids = create_assets([
+        {key: value for key, value in asset.items() if key != "evidence"}
+        for asset in SEED_ASSETS
+    ])
     
     print()
     
-    # Asset 3: Manicaland Orchard Estate
-    print("📍 Creating Asset 3: Manicaland Orchard Estate")
-    asset3_id = create_asset(
-        name="Manicaland Orchard Estate",
-        owner="Nyasha Chikwanha",
-        lat=-18.9707,
-        lon=32.6729,
-        size=25.8
-    )
-    
-    # Evidence for Asset 3
-    log_evidence(
-        asset3_id,
-        "Photo",
-        "Citrus orchard planting - 500 trees planted",
-        -18.9705,
-        32.6725
-    )
-    log_evidence(
-        asset3_id,
-        "Harvest Report",
-        "First harvest yield: 12 tonnes of oranges",
-        -18.9707,
-        32.6729
-    )
-    log_evidence(
-        asset3_id,
-        "Survey",
-        "Irrigation system installation completed",
-        -18.9710,
-        32.6730
-    )
-    log_evidence(
-        asset3_id,
-        "Document",
-        "Organic certification awarded by Zimbabwe Organic Producers",
-        -18.9707,
-        32.6729
-    )
+    # Log evidence for every asset in one request
+    evidence = [
+        {
+            "asset_id": asset_id,
+            "evidence_type": evidence_type,
+            "description": description,
+            "gps_lat": lat,
+            "gps_lon": lon
+        }
+        for asset_id, asset in zip(asset_ids, SEED_ASSETS)
+        for evidence_type, description, lat, lon in asset["evidence"]
+    ]
+    print(f"📸 Logging {len(evidence)} evidence records")
+    log_evidence(evidence)
     
     print()
     print("="*60)
     print("✅ SEEDING COMPLETE!")
     print("="*60)
-    print(f"\nCreated 3 assets with multiple evidence records")
+    print(f"\nCreated {len(asset_ids)} assets with multiple evidence records")
     print(f"You can now access the dashboard at http://localhost:8501")
     print()
 
@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from datetime import datetime
 
@@ -13,6 +14,17 @@ st.set_page_config(
 # API Base URL
 API_URL = "http://backend:8000"
 
+
+@st.cache_resource
+def get_http_session():
+    """Shared HTTP session, kept across reruns so connections stay alive"""
+    http = requests.Session()
+    http.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return http
+
+
+session = get_http_session()
+
 # Sidebar Navigation
 st.sidebar.title("🏞️ Land Truth Registry")
 st.sidebar.markdown("---")
@@ -22,12 +34,28 @@ page = st.sidebar.radio(
 )
 
 # Helper Functions
+# Cached fetchers raise on failure so errors are never cached;
+# the public helpers below report them in the UI.
+@st.cache_data(ttl=30)
+def fetch_assets():
+    """Fetch all assets from the API, cached across reruns"""
+    response = session.get(f"{API_URL}/assets/")
+    response.raise_for_status()
+    return response.json()["items"]
+
+
+@st.cache_data(ttl=10)
+def fetch_timeline(asset_id):
+    """Fetch timeline for an asset, cached across reruns"""
+    response = session.get(f"{API_URL}/assets/{asset_id}/timeline")
+    response.raise_for_status()
+    return response.json()
+
+
 def get_assets():
     """Fetch all assets from the API"""
     try:
-        response = requests.get(f"{API_URL}/assets/")
-        response.raise_for_status()
-        return response.json()
+        return fetch_assets()
     except Exception as e:
         st.error(f"Error fetching assets: {str(e)}")
         return []
@@ -43,8 +71,9 @@ def create_asset(name, owner, lat, lon, size):
             "location_lon": lon,
             "size_hectares": size
         }
-        response = requests.post(f"{API_URL}/assets/", json=payload)
+        response = session.post(f"{API_URL}/assets/", json=payload)
         response.raise_for_status()
+        fetch_assets.clear()
         return response.json()
     except Exception as e:
         st.error(f"Error creating asset: {str(e)}")
@@ -61,8 +90,9 @@ def create_evidence(asset_id, evidence_type, description, lat, lon):
             "gps_lat": lat,
             "gps_lon": lon
         }
-        response = requests.post(f"{API_URL}/evidence/", json=payload)
+        response = session.post(f"{API_URL}/evidence/", json=payload)
         response.raise_for_status()
+        fetch_timeline.clear()
         return response.json()
     except Exception as e:
         st.error(f"Error logging evidence: {str(e)}")
@@ -72,9 +102,7 @@ def create_evidence(asset_id, evidence_type, description, lat, lon):
 def get_timeline(asset_id):
     """Fetch timeline for an asset"""
     try:
-        response = requests.get(f"{API_URL}/assets/{asset_id}/timeline")
-        response.raise_for_status()
-        return response.json()
+        return fetch_timeline(asset_id)
     except Exception as e:
         st.error(f"Error fetching timeline: {str(e)}")
         return []
@@ -89,29 +117,29 @@ if page == "Dashboard":
     assets = get_assets()
     
     if assets:
+        # Compute metrics in a single pass over the assets
+        total_hectares = 0.0
+        owners = set()
+        for asset in assets:
+            total_hectares += asset['size_hectares']
+            owners.add(asset['owner'])
+        
         # Display asset count
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("Total Assets", len(assets))
         with col2:
-            total_hectares = sum([asset['size_hectares'] for asset in assets])
             st.metric("Total Land (hectares)", f"{total_hectares:.2f}")
         with col3:
-            unique_owners = len(set([asset['owner'] for asset in assets]))
-            st.metric("Unique Owners", unique_owners)
+            st.metric("Unique Owners", len(owners))
         
         st.markdown("---")
         
         # Map visualization
         st.subheader("🗺️ Asset Locations")
-        map_data = pd.DataFrame([
-            {
-                'lat': asset['location_lat'],
-                'lon': asset['location_lon'],
-                'name': asset['name']
-            }
-            for asset in assets
-        ])
+        map_data = pd.DataFrame.from_records(
+            assets, columns=['location_lat', 'location_lon', 'name']
+        ).rename(columns={'location_lat': 'lat', 'location_lon': 'lon'})
         st.map(map_data, zoom=6)
         
         st.markdown("---")